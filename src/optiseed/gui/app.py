@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict
+from typing import Any, Callable, Dict
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
 from optiseed.strategies import greedy_farthest_sample, lhs_sample, sobol_sample
@@ -20,31 +20,94 @@ def _method_registry() -> Dict[str, Callable[..., np.ndarray]]:
     }
 
 
+def _generate(
+    method_name: str,
+    n: int,
+    dims: int,
+    scramble: bool,
+    strength: int,
+    optimize: str | None,
+    candidate_multiplier: int,
+    seed: int | None,
+) -> np.ndarray:
+    """Run the selected sampler with the GUI parameters."""
+    sampler = _method_registry()[method_name]
+    kwargs = {"n": n, "dims": dims, "seed": seed}
+    if method_name == "Sobol":
+        kwargs["scramble"] = scramble
+    elif method_name == "Latin Hypercube":
+        kwargs["strength"] = strength
+        kwargs["optimize"] = optimize
+    elif method_name == "Greedy Farthest":
+        kwargs["candidate_multiplier"] = candidate_multiplier
+    return sampler(**kwargs)  # type: ignore[arg-type]
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _generate_seeded(
+    method_name: str,
+    n: int,
+    dims: int,
+    scramble: bool,
+    strength: int,
+    optimize: str | None,
+    candidate_multiplier: int,
+    seed: int,
+) -> np.ndarray:
+    """Memoize seeded runs, the only ones that can be requested again."""
+    return _generate(
+        method_name, n, dims, scramble, strength, optimize, candidate_multiplier, seed
+    )
+
+
+def _splom_dimensions(samples: np.ndarray) -> list[dict[str, Any]]:
+    """Build Splom dimension specs from sample columns."""
+    return [
+        {"label": f"x{i + 1}", "values": samples[:, i]} for i in range(samples.shape[1])
+    ]
+
+
 def _scatter_matrix(samples: np.ndarray) -> None:
-    """Render scatter matrix of samples."""
-    dims = samples.shape[1]
-    columns = [f"x{i}" for i in range(1, dims + 1)]
-    df = pd.DataFrame(samples, columns=columns)
-    fig = px.scatter_matrix(df, dimensions=columns, height=600)
-    st.plotly_chart(fig, width="stretch")
+    """Render scatter matrix of samples, updating the session's figure in place."""
+    dimensions = _splom_dimensions(samples)
+    fig = st.session_state.get("fig")
+    if fig is None:
+        splom = go.Splom(dimensions=dimensions, marker={"size": 3})
+        fig = go.Figure(data=splom, layout={"height": 600})
+        st.session_state["fig"] = fig
+    else:
+        fig.update_traces(dimensions=dimensions, overwrite=True)
+    # A stable key lets the frontend apply the new traces without remounting the chart.
+    st.plotly_chart(fig, key="splom", width="stretch")
 
 
 def main() -> None:
     st.set_page_config(page_title="Optiseed Sampler", layout="wide")
     st.title("Optiseed – Initial Sampling")
-    st.caption("Generate initial designs with Sobol or Latin Hypercube and inspect them.")
+    st.caption(
+        "Generate initial designs with Sobol or Latin Hypercube and inspect them."
+    )
 
     methods = _method_registry()
     method_name = st.selectbox("Seeding method", list(methods.keys()), index=0)
-    n_samples = st.number_input("Number of samples", min_value=1, max_value=50000, value=128, step=1)
+    n_samples = st.number_input(
+        "Number of samples", min_value=1, max_value=50000, value=128, step=1
+    )
     dims = st.number_input("Dimensions", min_value=1, max_value=64, value=3, step=1)
     seed = 0
     use_seed = False
 
     with st.expander("Advanced options", expanded=False):
         scramble = st.checkbox("Scramble (Sobol only)", value=True)
-        lhs_strength = st.number_input("LHS strength", min_value=1, max_value=3, value=1, step=1)
-        lhs_optimize = st.selectbox("LHS optimize", [None, "random-cd"], index=1, format_func=lambda x: "None" if x is None else x)
+        lhs_strength = st.number_input(
+            "LHS strength", min_value=1, max_value=3, value=1, step=1
+        )
+        lhs_optimize = st.selectbox(
+            "LHS optimize",
+            [None, "random-cd"],
+            index=1,
+            format_func=lambda x: "None" if x is None else x,
+        )
         greedy_multiplier = st.number_input(
             "Greedy candidate multiplier", min_value=10, max_value=200, value=50, step=5
         )
@@ -54,28 +117,35 @@ def main() -> None:
     generate = st.button("Generate samples")
 
     if generate:
-        sampler = methods[method_name]
-        kwargs = {"n": n_samples, "dims": dims}
-        if method_name == "Sobol":
-            kwargs["scramble"] = scramble
-            kwargs["seed"] = seed if use_seed else None
-        elif method_name == "Latin Hypercube":
-            kwargs["strength"] = lhs_strength
-            kwargs["optimize"] = lhs_optimize
-            kwargs["seed"] = seed if use_seed else None
-        elif method_name == "Greedy Farthest":
-            kwargs["candidate_multiplier"] = greedy_multiplier
-            kwargs["seed"] = seed if use_seed else None
+        params = (
+            method_name,
+            int(n_samples),
+            int(dims),
+            scramble,
+            int(lhs_strength),
+            lhs_optimize,
+            int(greedy_multiplier),
+        )
 
         try:
-            samples = sampler(**kwargs)  # type: ignore[arg-type]
+            # Unseeded runs bypass the cache: their results can never be hit
+            # again and would only evict seeded entries.
+            if use_seed:
+                samples = _generate_seeded(*params, int(seed))
+            else:
+                samples = _generate(*params, None)
         except Exception as exc:  # noqa: BLE001
             st.error(f"Failed to generate samples: {exc}")
             return
 
-        st.success(f"Generated {samples.shape[0]} samples in {samples.shape[1]} dimensions using {method_name}.")
+        st.success(
+            f"Generated {samples.shape[0]} samples in {samples.shape[1]} dimensions using {method_name}."
+        )
         st.dataframe(
-            pd.DataFrame(samples, columns=[f"x{i}" for i in range(1, dims + 1)]).head(),
+            pd.DataFrame(
+                {f"x{i + 1}": samples[:, i] for i in range(samples.shape[1])},
+                copy=False,
+            ).head(),
             width="stretch",
         )
         _scatter_matrix(samples)
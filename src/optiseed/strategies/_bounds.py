@@ -0,0 +1,42 @@
+"""Bounds handling shared by the sampling strategies."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+Bounds = Sequence[tuple[float, float]]
+
+
+def _validate_bounds(bounds: Bounds, dims: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Convert (low, high) pairs into lower/upper arrays in a single pass.
+
+    Args:
+        bounds: Sequence of (low, high) bounds per dimension.
+        dims: Expected dimensionality.
+
+    Returns:
+        Tuple of float64 arrays (lower, upper), each of shape (dims,).
+
+    Raises:
+        ValueError: If the bounds do not have shape (dims, 2) or any upper bound
+            does not exceed its lower bound (including NaN bounds).
+    """
+    if len(bounds) != dims:
+        raise ValueError("bounds length must match dims")
+    try:
+        arr = np.asarray(bounds, dtype=np.float64)
+    except (TypeError, ValueError) as exc:
+        # Ragged or non-numeric rows fail inside NumPy with a generic message.
+        raise ValueError(
+            f"expected bounds of shape ({dims}, 2) with numeric (low, high) pairs"
+        ) from exc
+    if arr.shape != (dims, 2):
+        raise ValueError(f"expected bounds of shape ({dims}, 2), got {arr.shape}")
+    lower, upper = arr[:, 0], arr[:, 1]
+    # Negated so NaN bounds are rejected as well.
+    if np.any(~(upper > lower)):
+        raise ValueError("each upper bound must be greater than its lower bound")
+    return lower, upper
@@ -0,0 +1,148 @@
+"""Numba Gray-code kernel for unscrambled Sobol sequences.
+
+The kernel reproduces ``scipy.stats.qmc.Sobol(scramble=False)`` bit-for-bit while
+skipping SciPy's per-call engine setup. It is only available when the optional
+``fast`` extra (Numba) is installed and SciPy exposes its direction-number helper.
+"""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+# Private SciPy helper that fills the Joe–Kuo direction numbers; the fast path is
+# disabled rather than breaking the import if SciPy moves it.
+try:
+    from scipy.stats._sobol import _initialize_v
+except ImportError:  # pragma: no cover - depends on SciPy internals
+    _initialize_v = None
+
+# Whether the Gray-code kernels can be used in this environment.
+AVAILABLE = numba is not None and _initialize_v is not None
+
+# Integer resolution of the generated points; matches SciPy's default.
+SOBOL_BITS = 30
+SOBOL_SCALE = 1.0 / 2**SOBOL_BITS
+# Samples per vectorized block in the lane kernel (one AVX2 register of uint32).
+LANES = 8
+# Above this many generated values (n * dims), the lane kernel is used.
+LANES_THRESHOLD = 1_000_000
+# Largest dims for which a kernel with the dimension loop unrolled is generated.
+MAX_SPECIALIZED_DIMS = 8
+
+
+@functools.lru_cache(maxsize=64)
+def direction_numbers(dims: int) -> np.ndarray:
+    """Return the read-only Joe–Kuo direction numbers, shape (dims, SOBOL_BITS)."""
+    v = np.zeros((dims, SOBOL_BITS), dtype=np.uint32)
+    _initialize_v(v, dim=dims, bits=SOBOL_BITS)
+    v.setflags(write=False)
+    return v
+
+
+@functools.lru_cache(maxsize=64)
+def direction_rows(dims: int) -> np.ndarray:
+    """Return the direction numbers as contiguous rows, shape (SOBOL_BITS, dims)."""
+    rows = np.ascontiguousarray(direction_numbers(dims).T)
+    rows.setflags(write=False)
+    return rows
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _ctz(i: int) -> int:  # pragma: no cover - JIT compiled
+        """Count trailing zero bits of a positive integer."""
+        k = 0
+        while i & 1 == 0:
+            i >>= 1
+            k += 1
+        return k
+
+    @numba.njit(cache=True)
+    def sobol_gray(
+        n: int, dims: int, direction_numbers: np.ndarray
+    ) -> np.ndarray:  # pragma: no cover - JIT compiled
+        """Return the first n Sobol points as integers via the Gray-code recurrence."""
+        out = np.empty((n, dims), dtype=np.uint32)
+        state = np.zeros(dims, dtype=np.uint32)
+        out[0] = state
+        for i in range(1, n):
+            k = _ctz(i)
+            for j in range(dims):
+                state[j] ^= direction_numbers[j, k]
+                out[i, j] = state[j]
+        return out
+
+    @numba.njit(parallel=True, cache=True)
+    def sobol_gray_lanes(
+        n: int, dims: int, direction_numbers: np.ndarray
+    ) -> np.ndarray:  # pragma: no cover - JIT compiled
+        """
+        Generate the first n Sobol points as integers, dimension-major (dims, n).
+
+        Within a block of LANES consecutive indices starting at a multiple of
+        LANES, ``gray(start + r) == gray(start) ^ gray(r)``, so every block is
+        its start point XORed with a fixed per-dimension lane table. The inner
+        loop is a branch-free LANES-wide XOR that LLVM vectorizes, and
+        dimensions are processed in parallel.
+        """
+        out = np.empty((dims, n), dtype=np.uint32)
+        blocks = (n + LANES - 1) // LANES
+        for j in numba.prange(dims):
+            lane = np.zeros(LANES, dtype=np.uint32)
+            for r in range(1, LANES):
+                lane[r] = lane[r - 1] ^ direction_numbers[j, _ctz(r)]
+            base = np.uint32(0)
+            for q in range(blocks):
+                start = q * LANES
+                if start + LANES <= n:
+                    for r in range(LANES):
+                        out[j, start + r] = base ^ lane[r]
+                else:
+                    for r in range(n - start):
+                        out[j, start + r] = base ^ lane[r]
+                if q + 1 < blocks:
+                    base = (
+                        base
+                        ^ lane[LANES - 1]
+                        ^ direction_numbers[j, _ctz(start + LANES)]
+                    )
+        return out
+
+    @functools.lru_cache(maxsize=MAX_SPECIALIZED_DIMS)
+    def specialized_sobol_gray(dims: int) -> Callable[[int, np.ndarray], np.ndarray]:
+        """
+        Return a Gray-code kernel with ``dims`` fixed at compile time.
+
+        ``dims`` is a closure constant, so LLVM fully unrolls the per-sample
+        XOR of the previous row with one row of :func:`direction_rows`. Numba
+        caches each variant on disk, so compilation is paid once per dims.
+        """
+
+        @numba.njit(cache=True)
+        def kernel(
+            n: int, direction_rows: np.ndarray
+        ) -> np.ndarray:  # pragma: no cover - JIT compiled
+            out = np.empty((n, dims), dtype=np.uint32)
+            for j in range(dims):
+                out[0, j] = 0
+            for i in range(1, n):
+                k = _ctz(i)
+                for j in range(dims):
+                    out[i, j] = out[i - 1, j] ^ direction_rows[k, j]
+            return out
+
+        return kernel
+
+else:
+    sobol_gray = None
+    sobol_gray_lanes = None
+    specialized_sobol_gray = None
@@ -2,12 +2,46 @@
 
 from __future__ import annotations
 
-from typing import Sequence, Tuple
+import functools
+from typing import Any
 
 import numpy as np
-from scipy.stats import qmc
+import numpy.typing as npt
+from scipy.spatial import cKDTree
 
-Bounds = Sequence[Tuple[float, float]]
+from ._bounds import Bounds, _validate_bounds
+from .sobol import _sobol_engine
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+# Without Numba, above this many distance evaluations (n * candidates), switch
+# to bucket pruning. The Numba kernel is preferred when available: it is faster
+# at higher dims even on one core and scales with the number of cores.
+_BUCKET_THRESHOLD = 10_000_000
+# Maximum number of candidates per KD-tree leaf bucket.
+_BUCKET_LEAFSIZE = 64
+# Box bounds stop pruning effectively in higher dimensions.
+_BUCKET_MAX_DIMS = 8
+
+# Below this n * dims, the NumPy loop beats loading the compiled Numba kernel.
+_SMALL_DESIGN = 1024
+
+_BACKENDS = ("cpu", "cuda")
+
+# Fused squared-distance + running-minimum update, one thread per candidate.
+_CUDA_MIN_SQ_UPDATE = """
+T s = 0;
+for (int d = 0; d < dims; ++d) {
+    T t = points[i * dims + d] - point[d];
+    s += t * t;
+}
+if (s < min_sq) {
+    min_sq = s;
+}
+"""
 
 
 def greedy_farthest_sample(
@@ -17,28 +51,47 @@ def greedy_farthest_sample(
     candidate_multiplier: int = 50,
     seed: int | None = None,
     bounds: Bounds | None = None,
+    dtype: npt.DTypeLike = np.float64,
+    backend: str = "cpu",
+    batch_size: int = 1,
 ) -> np.ndarray:
     """
     Select samples greedily by maximizing the minimum distance to existing points.
 
     A Sobol candidate pool is generated, and points are selected one-by-one by
     choosing the farthest point from the already selected set (Euclidean metric).
+    When the optional ``fast`` extra (Numba) is installed, the selection loop runs
+    as a compiled, multi-threaded kernel.
 
     Args:
         n: Number of samples to select.
         dims: Dimensionality of the search space.
-        candidate_multiplier: Multiplier for the candidate pool size relative to n.
-            Larger values improve coverage but increase cost (O(n * candidates)).
+        candidate_multiplier: Multiplier for the candidate pool size relative to n,
+            rounded up to the next power of two. Larger values improve coverage
+            but increase cost (O(n * candidates)).
         seed: Optional RNG seed for the Sobol candidate generator.
         bounds: Optional (low, high) bounds per dimension. If provided, length
             must equal dims.
+        dtype: Floating-point dtype of the returned array. It only affects the
+            final cast: selection always runs on an offset-free float32 scan
+            copy and picks the same points for every dtype. Note that float32
+            output cannot resolve points on bounds far from the origin.
+        backend: ``"cpu"`` (default) or ``"cuda"``. The CUDA backend keeps the
+            candidate pool on the GPU via CuPy and pays off for pools of roughly
+            1e6 candidates or more.
+        batch_size: Number of points accepted per greedy step. The default of 1
+            is exact greedy selection. Larger values take the ``batch_size``
+            farthest candidates at once and update distances with a single
+            matrix product, trading some maximin quality for speed on large
+            pools (CPU backend only).
 
     Returns:
         Array of shape (n, dims) with values in [0, 1] if no bounds are given,
         otherwise scaled to the provided bounds.
 
     Raises:
-        ValueError: On invalid inputs or if candidate pool is too small.
+        ValueError: On invalid inputs.
+        RuntimeError: If ``backend="cuda"`` is requested but CuPy is unavailable.
     """
     if n <= 0:
         raise ValueError("n must be positive")
@@ -46,44 +99,275 @@ def greedy_farthest_sample(
         raise ValueError("dims must be positive")
     if candidate_multiplier <= 0:
         raise ValueError("candidate_multiplier must be positive")
-    if bounds is not None and len(bounds) != dims:
-        raise ValueError("bounds length must match dims")
+    if bounds is not None:
+        lower, upper = _validate_bounds(bounds, dims)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError("dtype must be a floating-point type")
+    if backend not in _BACKENDS:
+        raise ValueError(f"backend must be one of {_BACKENDS}, got {backend!r}")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if batch_size > 1 and backend != "cpu":
+        raise ValueError("batch_size > 1 is only supported with backend='cpu'")
 
-    # Sobol balance properties require power-of-two sample sizes.
+    # Sobol balance properties require power-of-two sample sizes. The whole
+    # power-of-two pool is kept: the extra candidates only improve selection.
     min_candidates = max(n * candidate_multiplier, n + 1)
     power = int(np.ceil(np.log2(min_candidates)))
-    sampler = qmc.Sobol(d=dims, scramble=True, seed=seed)
+    sampler = _sobol_engine(dims, True, seed)
     candidates = sampler.random_base2(m=power)
-    # Trim if we generated more than needed.
-    if candidates.shape[0] > min_candidates:
-        candidates = candidates[:min_candidates]
+
+    # Distances are scanned in float32, which halves the bytes moved per
+    # iteration. The scan copy is taken from the unit cube before any offset is
+    # applied, and bounds widths are normalized by the largest one: the argmax
+    # is invariant to a uniform scale, and this keeps float32 from losing
+    # resolution (or overflowing) on large or far-offset bounds.
+    points = candidates.astype(np.float32)
 
     if bounds is not None:
-        lower, upper = zip(*bounds)
-        lower_arr = np.array(lower, dtype=float)
-        upper_arr = np.array(upper, dtype=float)
-        if np.any(upper_arr <= lower_arr):
-            raise ValueError("each upper bound must be greater than its lower bound")
-        candidates = qmc.scale(candidates, lower_arr, upper_arr)
+        width = upper - lower
+        np.multiply(points, (width / width.max()).astype(np.float32), out=points)
+        # Scale in place; qmc.scale would allocate a second pool-sized array.
+        np.multiply(candidates, width, out=candidates)
+        np.add(candidates, lower, out=candidates)
 
-    if candidates.shape[0] < n:
-        raise ValueError("candidate pool must be at least as large as n")
+    if backend == "cuda":
+        indices = _gfp_cuda(points, n)
+    elif batch_size > 1:
+        indices = _gfp_batched(points, n, batch_size)
+    elif _gfp_core is not None and n * dims >= _SMALL_DESIGN:
+        indices = _gfp_core(points, n)
+    elif n * points.shape[0] > _BUCKET_THRESHOLD and dims <= _BUCKET_MAX_DIMS:
+        indices = _gfp_buckets(points, n)
+    else:
+        indices = _gfp_numpy(points, n)
 
-    selected = np.empty((n, dims), dtype=float)
+    return candidates[indices].astype(dtype, copy=False)
+
+
+def _gfp_numpy(points: np.ndarray, n: int) -> np.ndarray:
+    """Greedy maximin selection using vectorized NumPy updates; returns row indices."""
+    indices = np.empty(n, dtype=np.intp)
 
     # Pick the first point deterministically from the candidate set.
-    selected[0] = candidates[0]
-    remaining = candidates[1:]
+    indices[0] = 0
+    remaining = points[1:]
 
-    # Track the minimum distance from each candidate to the selected set.
-    min_dists = np.linalg.norm(remaining - selected[0], axis=1)
+    # Track the minimum squared distance from each candidate to the selected set.
+    # Squared distances preserve the argmax, so the sqrt is skipped entirely.
+    diff_buf = np.empty_like(remaining)
+    new_sq = np.empty(remaining.shape[0], dtype=remaining.dtype)
+    np.subtract(remaining, points[0], out=diff_buf)
+    min_sq = np.einsum("ij,ij->i", diff_buf, diff_buf)
 
     for i in range(1, n):
-        idx = int(np.argmax(min_dists))
-        selected[i] = remaining[idx]
+        idx = min_sq.argmax()
+        indices[i] = idx + 1
+
+        # Update distances in place after adding the new point.
+        np.subtract(remaining, remaining[idx], out=diff_buf)
+        np.einsum("ij,ij->i", diff_buf, diff_buf, out=new_sq)
+        np.minimum(min_sq, new_sq, out=min_sq)
+
+    return indices
+
+
+def _gfp_buckets(points: np.ndarray, n: int) -> np.ndarray:
+    """
+    Greedy maximin selection with KD-tree bucket pruning; returns row indices.
+
+    Candidates are grouped into KD-tree leaf buckets with axis-aligned bounding
+    boxes. A newly selected point can only lower the distances of candidates
+    whose bucket box is closer to it than the bucket's current maximum, so all
+    other buckets are skipped. The result matches the exhaustive search up to
+    tie-breaking between equidistant candidates.
+    """
+    indices = np.empty(n, dtype=np.intp)
+    indices[0] = 0
+    remaining = points[1:]
+
+    tree = cKDTree(remaining, leafsize=_BUCKET_LEAFSIZE, balanced_tree=False)
+    starts = []
+    stack = [tree.tree]
+    while stack:
+        node = stack.pop()
+        if node.split_dim == -1:
+            starts.append(node.start_idx)
+        else:
+            stack.append(node.greater)
+            stack.append(node.lesser)
+    starts_arr = np.sort(np.asarray(starts, dtype=np.intp))
+    sizes = np.diff(np.append(starts_arr, remaining.shape[0]))
+
+    # Reorder candidates so every bucket is a contiguous slice.
+    order = tree.indices
+    ordered = remaining[order]
+    box_lo = np.minimum.reduceat(ordered, starts_arr, axis=0)
+    box_hi = np.maximum.reduceat(ordered, starts_arr, axis=0)
+
+    diff = ordered - points[0]
+    min_sq = np.einsum("ij,ij->i", diff, diff)
+    bucket_max = np.maximum.reduceat(min_sq, starts_arr)
+
+    # Per-bucket work buffers reused across iterations.
+    gap_lo = np.empty_like(box_lo)
+    gap_hi = np.empty_like(box_hi)
+    bound_sq = np.empty(box_lo.shape[0], dtype=box_lo.dtype)
+
+    for i in range(1, n):
+        b = bucket_max.argmax()
+        start = starts_arr[b]
+        idx = start + min_sq[start : start + sizes[b]].argmax()
+        indices[i] = order[idx] + 1
+        point = ordered[idx]
+
+        # Squared distance from the new point to each bucket box is a lower bound
+        # on the distance to every candidate inside it.
+        np.subtract(box_lo, point, out=gap_lo)
+        np.maximum(gap_lo, 0.0, out=gap_lo)
+        np.subtract(point, box_hi, out=gap_hi)
+        np.maximum(gap_hi, 0.0, out=gap_hi)
+        np.add(gap_lo, gap_hi, out=gap_lo)
+        np.einsum("ij,ij->i", gap_lo, gap_lo, out=bound_sq)
+        active = np.flatnonzero(bound_sq < bucket_max)
+        if active.size == 0:
+            continue
+
+        # Gather the candidate indices of all active buckets in one pass.
+        active_sizes = sizes[active]
+        offsets = np.cumsum(active_sizes) - active_sizes
+        rows = np.arange(active_sizes.sum()) + np.repeat(
+            starts_arr[active] - offsets, active_sizes
+        )
+
+        # The fancy-indexed gathers copy; subtract and clamp into those copies in place.
+        diff = ordered[rows]
+        np.subtract(diff, point, out=diff)
+        updated = np.einsum("ij,ij->i", diff, diff)
+        np.minimum(updated, min_sq[rows], out=updated)
+        min_sq[rows] = updated
+        bucket_max[active] = np.maximum.reduceat(updated, offsets)
+
+    return indices
+
+
+def _gfp_batched(points: np.ndarray, n: int, batch_size: int) -> np.ndarray:
+    """
+    Approximate greedy selection, batch_size points per step; returns row indices.
+
+    Squared distances to a batch are expanded as ``|r|^2 + |s|^2 - 2 r.s`` so
+    the update is one GEMM against the batch instead of one subtraction pass
+    per accepted point.
+    """
+    indices = np.empty(n, dtype=np.intp)
+    indices[0] = 0
+    remaining = points[1:]
+
+    r_sq = np.einsum("ij,ij->i", remaining, remaining)
+    diff = remaining - points[0]
+    min_sq = np.einsum("ij,ij->i", diff, diff)
+
+    count = 1
+    while count < n:
+        k = min(batch_size, n - count)
+        top = np.argpartition(min_sq, -k)[-k:]
+        top = top[np.argsort(-min_sq[top], kind="stable")]
+        indices[count : count + k] = top + 1
+        # Mask accepted rows explicitly: the expanded update below leaves them a
+        # small positive rounding error instead of zero, which can win on dense
+        # pools.
+        min_sq[top] = -np.inf
+        count += k
+        if count == n:
+            break
+
+        batch = remaining[top]
+        s_sq = np.einsum("ij,ij->i", batch, batch)
+        new_sq = remaining @ batch.T
+        new_sq *= -2.0
+        new_sq += r_sq[:, None]
+        new_sq += s_sq[None, :]
+        np.minimum(min_sq, new_sq.min(axis=1), out=min_sq)
+
+    return indices
+
+
+@functools.cache
+def _cuda_min_sq_update() -> Any:
+    """Compile the fused CuPy update kernel once per process."""
+    import cupy as cp
+
+    return cp.ElementwiseKernel(
+        "raw T points, raw T point, int32 dims",
+        "T min_sq",
+        _CUDA_MIN_SQ_UPDATE,
+        "optiseed_gfp_min_sq_update",
+    )
+
+
+def _gfp_cuda(points: np.ndarray, n: int) -> np.ndarray:
+    """
+    Greedy maximin selection on the GPU; returns row indices.
+
+    The candidate pool is transferred once; each iteration runs one fused
+    distance/min kernel, and the argmax index is the only host sync.
+    """
+    try:
+        import cupy as cp
+    except ImportError as exc:
+        raise RuntimeError(
+            "backend='cuda' requires CuPy; install a cupy-cuda* wheel"
+        ) from exc
+
+    remaining = cp.asarray(np.ascontiguousarray(points[1:]))
+    dims = np.int32(points.shape[1])
+    update = _cuda_min_sq_update()
+
+    min_sq = cp.full(remaining.shape[0], cp.inf, dtype=remaining.dtype)
+    update(remaining, cp.asarray(points[0]), dims, min_sq)
+
+    indices = np.empty(n, dtype=np.intp)
+    indices[0] = 0
+    for i in range(1, n):
+        idx = int(cp.argmax(min_sq))
+        indices[i] = idx + 1
+        update(remaining, remaining[idx], dims, min_sq)
+
+    return indices
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _gfp_core(
+        points: np.ndarray, n: int
+    ) -> np.ndarray:  # pragma: no cover - JIT compiled
+        """Greedy maximin selection fused into a single parallel pass per iteration."""
+        m = points.shape[0] - 1
+        dims = points.shape[1]
+        indices = np.empty(n, dtype=np.intp)
+        indices[0] = 0
+        remaining = points[1:]
+
+        min_sq = np.empty(m, dtype=points.dtype)
+        for k in numba.prange(m):
+            s = np.float32(0.0)
+            for d in range(dims):
+                t = remaining[k, d] - points[0, d]
+                s += t * t
+            min_sq[k] = s
+
+        for i in range(1, n):
+            idx = np.argmax(min_sq)
+            indices[i] = idx + 1
+            for k in numba.prange(m):
+                s = np.float32(0.0)
+                for d in range(dims):
+                    t = remaining[k, d] - remaining[idx, d]
+                    s += t * t
+                min_sq[k] = min(min_sq[k], s)
 
-        # Update distances after adding the new point.
-        new_dists = np.linalg.norm(remaining - selected[i], axis=1)
-        min_dists = np.minimum(min_dists, new_dists)
+        return indices
 
-    return selected
+else:
+    _gfp_core = None
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Sequence, Tuple
-
 import numpy as np
+import numpy.typing as npt
 from scipy.stats import qmc
 
-Bounds = Sequence[Tuple[float, float]]
+from ._bounds import Bounds, _validate_bounds
 
 
 def lhs_sample(
@@ -18,6 +17,7 @@ def lhs_sample(
     optimize: str | None = "random-cd",
     seed: int | None = None,
     bounds: Bounds | None = None,
+    dtype: npt.DTypeLike = np.float64,
 ) -> np.ndarray:
     """
     Generate Latin Hypercube samples.
@@ -32,6 +32,9 @@ def lhs_sample(
         seed: Optional RNG seed for reproducibility.
         bounds: Optional sequence of (low, high) bounds per dimension. If
             provided, its length must equal `dims`.
+        dtype: Floating-point dtype of the returned array. It only casts the
+            output: samples are generated in float64 either way, so
+            ``np.float32`` does not lower peak memory.
 
     Returns:
         Array of shape (n, dims) with values in [0, 1] if no bounds are given,
@@ -45,8 +48,10 @@ def lhs_sample(
         raise ValueError("n must be positive")
     if dims <= 0:
         raise ValueError("dims must be positive")
-    if bounds is not None and len(bounds) != dims:
-        raise ValueError("bounds length must match dims")
+    if bounds is not None:
+        lower, upper = _validate_bounds(bounds, dims)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError("dtype must be a floating-point type")
 
     sampler = qmc.LatinHypercube(
         d=dims,
@@ -57,12 +62,6 @@ def lhs_sample(
     samples = sampler.random(n)
 
     if bounds is None:
-        return samples
-
-    lower, upper = zip(*bounds)
-    lower_arr = np.array(lower, dtype=float)
-    upper_arr = np.array(upper, dtype=float)
-    if np.any(upper_arr <= lower_arr):
-        raise ValueError("each upper bound must be greater than its lower bound")
+        return samples.astype(dtype, copy=False)
 
-    return qmc.scale(samples, lower_arr, upper_arr)
+    return qmc.scale(samples, lower, upper).astype(dtype, copy=False)
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Sequence, Tuple
+import copy
+import functools
+import os
 
 import numpy as np
+import numpy.typing as npt
 from scipy.stats import qmc
 
-
-Bounds = Sequence[Tuple[float, float]]
+from . import _sobol_core
+from ._bounds import Bounds, _validate_bounds
 
 
 def sobol_sample(
@@ -18,6 +21,7 @@ def sobol_sample(
     scramble: bool = True,
     seed: int | None = None,
     bounds: Bounds | None = None,
+    dtype: npt.DTypeLike = np.float64,
 ) -> np.ndarray:
     """
     Generate Sobol quasi-random samples.
@@ -25,10 +29,15 @@ def sobol_sample(
     Args:
         n: Number of samples to draw.
         dims: Dimensionality of the search space.
-        scramble: Whether to use Owen scrambling for better uniformity.
+        scramble: Whether to use Owen scrambling for better uniformity. Unscrambled
+            sequences use a Numba Gray-code kernel instead of SciPy when
+            ``OPTISEED_FAST_SOBOL=1`` is set and the ``fast`` extra is installed.
         seed: Optional RNG seed for reproducibility when scrambling.
         bounds: Optional sequence of (low, high) bounds per dimension. If
             provided, its length must equal `dims`.
+        dtype: Floating-point dtype of the returned array. It only casts the
+            output: samples are generated in float64 either way, so
+            ``np.float32`` does not lower peak memory.
 
     Returns:
         Array of shape (n, dims) with values in [0, 1] if no bounds are given,
@@ -42,19 +51,64 @@ def sobol_sample(
         raise ValueError("n must be positive")
     if dims <= 0:
         raise ValueError("dims must be positive")
-    if bounds is not None and len(bounds) != dims:
-        raise ValueError("bounds length must match dims")
+    if bounds is not None:
+        lower, upper = _validate_bounds(bounds, dims)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError("dtype must be a floating-point type")
 
-    sampler = qmc.Sobol(d=dims, scramble=scramble, seed=seed)
-    samples = sampler.random(n)
+    if _use_fast_sobol(n, dims, scramble):
+        directions = _sobol_core.direction_numbers(dims)
+        if n * dims >= _sobol_core.LANES_THRESHOLD:
+            raw = _sobol_core.sobol_gray_lanes(n, dims, directions)
+            samples = np.multiply(raw.T, _sobol_core.SOBOL_SCALE, order="C")
+        elif dims <= _sobol_core.MAX_SPECIALIZED_DIMS:
+            kernel = _sobol_core.specialized_sobol_gray(dims)
+            samples = (
+                kernel(n, _sobol_core.direction_rows(dims)) * _sobol_core.SOBOL_SCALE
+            )
+        else:
+            raw = _sobol_core.sobol_gray(n, dims, directions)
+            samples = raw * _sobol_core.SOBOL_SCALE
+    else:
+        sampler = _sobol_engine(dims, scramble, seed)
+        samples = sampler.random(n)
 
     if bounds is None:
-        return samples
+        return samples.astype(dtype, copy=False)
+
+    return qmc.scale(samples, lower, upper).astype(dtype, copy=False)
+
+
+def _use_fast_sobol(n: int, dims: int, scramble: bool) -> bool:
+    """Return True if the Numba Gray-code kernel can replace SciPy's Sobol engine."""
+    return (
+        os.environ.get("OPTISEED_FAST_SOBOL") == "1"
+        and _sobol_core.AVAILABLE
+        and not scramble
+        and n <= 2**_sobol_core.SOBOL_BITS
+        and dims <= qmc.Sobol.MAXDIM
+    )
+
 
-    lower, upper = zip(*bounds)
-    lower_arr = np.array(lower, dtype=float)
-    upper_arr = np.array(upper, dtype=float)
-    if np.any(upper_arr <= lower_arr):
-        raise ValueError("each upper bound must be greater than its lower bound")
+@functools.lru_cache(maxsize=64)
+def _cached_sampler(dims: int, scramble: bool, seed: int | None) -> qmc.Sobol:
+    """Return a prototype Sobol engine; never draw from it directly."""
+    return qmc.Sobol(d=dims, scramble=scramble, seed=seed)
 
-    return qmc.scale(samples, lower_arr, upper_arr)
+
+def _sobol_engine(dims: int, scramble: bool, seed: int | None) -> qmc.Sobol:
+    """
+    Return a fresh Sobol engine, reusing cached direction numbers when possible.
+
+    Engine construction (direction numbers plus LMS scrambling) dominates small
+    draws, so engines are built once per (dims, scramble, seed) and handed out
+    as reset deep copies; no mutable state is shared with the cached prototype.
+    Unseeded scrambled engines are never cached, as each call must draw new
+    scrambling.
+    """
+    if scramble and not isinstance(seed, (int, np.integer)):
+        return qmc.Sobol(d=dims, scramble=True, seed=seed)
+    prototype = _cached_sampler(dims, scramble, int(seed) if scramble else None)
+    engine = copy.deepcopy(prototype)
+    engine.reset()
+    return engine
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from optiseed import greedy_farthest_sample, lhs_sample, sobol_sample
+from optiseed.strategies._bounds import _validate_bounds
+
+SAMPLERS = [sobol_sample, lhs_sample, greedy_farthest_sample]
+
+
+def test_validate_bounds_splits_lower_and_upper():
+    lower, upper = _validate_bounds([(0, 1), (-2.5, 3)], 2)
+
+    assert lower.dtype == upper.dtype == np.float64
+    np.testing.assert_array_equal(lower, [0.0, -2.5])
+    np.testing.assert_array_equal(upper, [1.0, 3.0])
+
+
+@pytest.mark.parametrize(
+    "bounds, match",
+    [
+        ([(0.0, 1.0)], "length"),
+        ([(0.0, 1.0, 2.0), (0.0, 1.0, 2.0)], r"shape \(2, 2\)"),
+        ([(0.0, 1.0), (2.0, 2.0)], "upper bound"),
+        ([(1.0, 0.0), (0.0, 1.0)], "upper bound"),
+        ([(0.0, 1.0), (0.0, 1.0, 2.0)], r"shape \(2, 2\)"),
+        ([(0.0, 1.0), (0.0, "high")], r"shape \(2, 2\)"),
+        ([(0.0, 1.0), (0.0, float("nan"))], "upper bound"),
+        ([(float("nan"), 1.0), (0.0, 1.0)], "upper bound"),
+    ],
+)
+@pytest.mark.parametrize("sampler", SAMPLERS)
+def test_samplers_reject_invalid_bounds(sampler, bounds, match):
+    with pytest.raises(ValueError, match=match):
+        sampler(4, 2, bounds=bounds)
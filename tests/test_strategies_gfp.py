@@ -0,0 +1,329 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import pdist
+from scipy.stats import qmc
+
+from optiseed import greedy_farthest_sample
+
+
+def _candidate_pool(n, dims, seed, candidate_multiplier=50):
+    min_candidates = max(n * candidate_multiplier, n + 1)
+    power = int(np.ceil(np.log2(min_candidates)))
+    return qmc.Sobol(dims, seed=seed).random_base2(power)
+
+
+def _reference_greedy(pool, n):
+    """Plain maximin selection on Euclidean norms, one point at a time."""
+    chosen = [0]
+    min_dists = np.linalg.norm(pool - pool[0], axis=1)
+    for _ in range(1, n):
+        idx = int(np.argmax(min_dists))
+        chosen.append(idx)
+        min_dists = np.minimum(min_dists, np.linalg.norm(pool - pool[idx], axis=1))
+    return pool[chosen]
+
+
+@pytest.mark.parametrize("dims", [1, 3, 6])
+def test_greedy_matches_reference_selection(dims):
+    expected = _reference_greedy(_candidate_pool(40, dims, seed=2), 40)
+
+    samples = greedy_farthest_sample(40, dims, seed=2)
+
+    np.testing.assert_array_equal(samples, expected)
+
+
+def test_greedy_is_reproducible_with_seed():
+    first = greedy_farthest_sample(32, 3, seed=4)
+    second = greedy_farthest_sample(32, 3, seed=4)
+
+    np.testing.assert_array_equal(first, second)
+
+
+def test_greedy_respects_bounds():
+    bounds = [(-2.0, 2.0), (10.0, 11.0)]
+
+    samples = greedy_farthest_sample(50, 2, seed=0, bounds=bounds)
+
+    assert samples.shape == (50, 2)
+    assert np.all(samples >= [-2.0, 10.0]) and np.all(samples <= [2.0, 11.0])
+    assert len(np.unique(samples, axis=0)) == 50
+
+
+def test_greedy_numba_kernel_matches_numpy_path(monkeypatch):
+    from optiseed.strategies import gfp
+
+    if gfp._gfp_core is None:
+        pytest.skip("numba not installed")
+    compiled = greedy_farthest_sample(256, 4, seed=3, candidate_multiplier=8)
+    monkeypatch.setattr(gfp, "_gfp_core", None)
+
+    np.testing.assert_array_equal(
+        compiled, greedy_farthest_sample(256, 4, seed=3, candidate_multiplier=8)
+    )
+
+
+def _spy(monkeypatch, module, name):
+    calls = []
+    original = getattr(module, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, wrapper)
+    return calls
+
+
+@pytest.mark.parametrize("dims", [2, 5])
+def test_greedy_bucket_pruning_matches_exhaustive_search(monkeypatch, dims):
+    from optiseed.strategies import gfp
+
+    monkeypatch.setattr(gfp, "_gfp_core", None)
+    expected = greedy_farthest_sample(400, dims, seed=1, candidate_multiplier=20)
+    monkeypatch.setattr(gfp, "_BUCKET_THRESHOLD", 0)
+    calls = _spy(monkeypatch, gfp, "_gfp_buckets")
+
+    samples = greedy_farthest_sample(400, dims, seed=1, candidate_multiplier=20)
+
+    assert calls
+    np.testing.assert_array_equal(samples, expected)
+
+
+def test_greedy_bucket_pruning_skips_high_dims(monkeypatch):
+    from optiseed.strategies import gfp
+
+    monkeypatch.setattr(gfp, "_gfp_core", None)
+    monkeypatch.setattr(gfp, "_BUCKET_THRESHOLD", 0)
+    calls = _spy(monkeypatch, gfp, "_gfp_buckets")
+
+    greedy_farthest_sample(16, gfp._BUCKET_MAX_DIMS + 1, seed=0)
+
+    assert calls == []
+
+
+def test_greedy_float32_output_stays_in_bounds():
+    bounds = [(-1.0, 1.0), (0.0, 4.0), (2.0, 3.0)]
+
+    samples = greedy_farthest_sample(32, 3, seed=1, bounds=bounds, dtype=np.float32)
+
+    assert samples.dtype == np.float32
+    assert np.all(samples >= [-1.0, 0.0, 2.0]) and np.all(samples <= [1.0, 4.0, 3.0])
+    assert len(np.unique(samples, axis=0)) == 32
+
+
+@pytest.mark.parametrize("dtype", [int, np.int32, bool])
+def test_greedy_rejects_non_float_dtype(dtype):
+    with pytest.raises(ValueError, match="dtype"):
+        greedy_farthest_sample(4, 2, dtype=dtype)
+
+
+def test_greedy_scales_pool_to_bounds():
+    lower, upper = np.array([-3.0, 0.0, 10.0]), np.array([1.0, 0.5, 20.0])
+    pool = qmc.scale(_candidate_pool(40, 3, seed=6), lower, upper)
+
+    samples = greedy_farthest_sample(40, 3, seed=6, bounds=list(zip(lower, upper)))
+
+    np.testing.assert_allclose(samples, _reference_greedy(pool, 40))
+
+
+def _numpy_cupy_stand_in():
+    """Module exposing the slice of the CuPy API used by the CUDA backend."""
+    cupy = types.ModuleType("cupy")
+    cupy.inf = np.inf
+    cupy.asarray = np.asarray
+    cupy.full = np.full
+    cupy.argmax = np.argmax
+
+    def elementwise_kernel(in_params, out_params, operation, name):
+        def update(points, point, dims, min_sq):
+            diff = points.reshape(-1, int(dims)) - point
+            np.minimum(min_sq, np.einsum("ij,ij->i", diff, diff), out=min_sq)
+
+        return update
+
+    cupy.ElementwiseKernel = elementwise_kernel
+    return cupy
+
+
+def test_greedy_cuda_backend_matches_cpu(monkeypatch):
+    from optiseed.strategies import gfp
+
+    expected = greedy_farthest_sample(48, 3, seed=8)
+    monkeypatch.setitem(sys.modules, "cupy", _numpy_cupy_stand_in())
+    gfp._cuda_min_sq_update.cache_clear()
+    try:
+        samples = greedy_farthest_sample(48, 3, seed=8, backend="cuda")
+    finally:
+        gfp._cuda_min_sq_update.cache_clear()
+
+    np.testing.assert_array_equal(samples, expected)
+
+
+def test_greedy_cuda_without_cupy_raises_runtime_error(monkeypatch):
+    monkeypatch.setitem(sys.modules, "cupy", None)
+
+    with pytest.raises(RuntimeError, match="CuPy"):
+        greedy_farthest_sample(4, 2, backend="cuda")
+
+
+def test_greedy_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="backend"):
+        greedy_farthest_sample(4, 2, backend="gpu")
+
+
+def test_greedy_returns_full_precision_pool_rows():
+    pool = _candidate_pool(32, 3, seed=5)
+
+    samples = greedy_farthest_sample(32, 3, seed=5)
+
+    assert samples.dtype == np.float64
+    assert not np.array_equal(samples, samples.astype(np.float32))
+    assert (samples[:, None] == pool[None]).all(axis=-1).any(axis=1).all()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    return qmc.Sobol(3, seed=5).random_base2(12).astype(np.float32)
+
+
+def test_greedy_paths_agree_on_same_pool(pool):
+    from optiseed.strategies import gfp
+
+    expected = gfp._gfp_numpy(pool, 64)
+
+    np.testing.assert_array_equal(gfp._gfp_batched(pool, 64, 1), expected)
+    np.testing.assert_array_equal(gfp._gfp_buckets(pool, 64), expected)
+    if gfp._gfp_core is not None:
+        np.testing.assert_array_equal(gfp._gfp_core(pool, 64), expected)
+
+
+@pytest.mark.parametrize("batch_size", [2, 16, 100])
+def test_greedy_batched_returns_distinct_points(pool, batch_size):
+    from optiseed.strategies import gfp
+
+    indices = gfp._gfp_batched(pool, 64, batch_size)
+
+    assert indices[0] == 0
+    assert len(np.unique(indices)) == 64
+    assert np.all((indices >= 0) & (indices < pool.shape[0]))
+
+
+def test_greedy_batch_size_public_option():
+    samples = greedy_farthest_sample(40, 2, seed=0, batch_size=8)
+
+    assert samples.shape == (40, 2)
+    assert len(np.unique(samples, axis=0)) == 40
+
+
+@pytest.mark.parametrize("batch_size", [2, 3, 16, 64])
+def test_greedy_batched_never_repeats_on_dense_pool(batch_size):
+    from optiseed.strategies import gfp
+
+    dense = qmc.Sobol(1, seed=0).random_base2(10).astype(np.float32)
+
+    indices = gfp._gfp_batched(dense, 1023, batch_size)
+
+    assert len(np.unique(indices)) == 1023
+
+
+def test_greedy_batched_public_option_on_dense_pool():
+    samples = greedy_farthest_sample(
+        1023, 1, seed=0, candidate_multiplier=1, batch_size=16
+    )
+
+    assert len(np.unique(samples, axis=0)) == 1023
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"batch_size": 0}, {"batch_size": -3}, {"backend": "cuda", "batch_size": 4}],
+)
+def test_greedy_rejects_invalid_batch_size(kwargs):
+    with pytest.raises(ValueError, match="batch_size"):
+        greedy_farthest_sample(4, 2, **kwargs)
+
+
+def test_greedy_repeated_seeded_calls_match_fresh_engine():
+    expected = _reference_greedy(_candidate_pool(20, 3, seed=11), 20)
+
+    greedy_farthest_sample(20, 3, seed=11)
+    samples = greedy_farthest_sample(20, 3, seed=11)
+
+    np.testing.assert_array_equal(samples, expected)
+
+
+def test_greedy_draws_from_the_whole_power_of_two_pool():
+    pool = _candidate_pool(40, 2, seed=0, candidate_multiplier=3)
+
+    samples = greedy_farthest_sample(40, 2, seed=0, candidate_multiplier=3)
+
+    assert pool.shape[0] == 128
+    rows = (samples[:, None] == pool[None]).all(axis=-1).argmax(axis=1)
+    assert rows.max() >= 40 * 3
+
+
+def test_greedy_small_designs_skip_the_numba_kernel(monkeypatch):
+    from optiseed.strategies import gfp
+
+    monkeypatch.setattr(gfp, "_gfp_core", lambda points, n: pytest.fail("compiled"))
+
+    samples = greedy_farthest_sample(8, 3, seed=0)
+
+    assert samples.shape == (8, 3)
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        [(1e7, 1e7 + 1)] * 2,
+        [(0.0, 1e39)] * 2,
+        [(-1e12, -1e12 + 5.0), (3.0, 4.0)],
+    ],
+)
+def test_greedy_large_offset_bounds_match_unit_selection(bounds):
+    unit = greedy_farthest_sample(64, 2, seed=0, bounds=[(0.0, 1.0), (0.0, 1.0)])
+    lower = np.array([b[0] for b in bounds])
+    upper = np.array([b[1] for b in bounds])
+    width = upper - lower
+
+    samples = greedy_farthest_sample(64, 2, seed=0, bounds=bounds)
+
+    assert np.all(np.isfinite(samples))
+    assert len(np.unique(samples, axis=0)) == 64
+    if np.allclose(width, width[0]):
+        # Uniform widths: the design is the unit design, scaled and shifted.
+        np.testing.assert_allclose(
+            (samples - lower) / width, unit, rtol=1e-6, atol=1e-6
+        )
+
+
+def test_greedy_offset_bounds_keep_spacing():
+    samples = greedy_farthest_sample(64, 2, seed=0, bounds=[(1e7, 1e7 + 1)] * 2)
+
+    assert pdist(samples).min() > 0.05
+
+
+def test_greedy_dtype_only_casts_output():
+    bounds = [(1e3, 1e3 + 2.0), (-5.0, 5.0), (0.0, 1.0)]
+    full = greedy_farthest_sample(32, 3, seed=1, bounds=bounds)
+    half = greedy_farthest_sample(32, 3, seed=1, bounds=bounds, dtype=np.float32)
+
+    assert full.dtype == np.float64
+    assert half.dtype == np.float32
+    np.testing.assert_array_equal(half, full.astype(np.float32))
+
+
+def test_greedy_prefers_numba_kernel_for_large_pools(monkeypatch):
+    from optiseed.strategies import gfp
+
+    if gfp._gfp_core is None:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(gfp, "_BUCKET_THRESHOLD", 0)
+    calls = _spy(monkeypatch, gfp, "_gfp_buckets")
+
+    greedy_farthest_sample(256, 4, seed=0, candidate_multiplier=4)
+
+    assert calls == []
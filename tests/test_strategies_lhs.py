@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from optiseed import lhs_sample
+
+
+@pytest.mark.parametrize("bounds", [None, [(-1.0, 1.0), (5.0, 6.0)]])
+def test_lhs_dtype_casts_output(bounds):
+    full = lhs_sample(16, 2, seed=0, bounds=bounds)
+    half = lhs_sample(16, 2, seed=0, bounds=bounds, dtype=np.float32)
+
+    assert full.dtype == np.float64
+    assert half.dtype == np.float32
+    np.testing.assert_array_equal(half, full.astype(np.float32))
+
+
+@pytest.mark.parametrize("dtype", [int, np.int64, bool])
+def test_lhs_rejects_non_float_dtype(dtype):
+    with pytest.raises(ValueError, match="dtype"):
+        lhs_sample(4, 2, dtype=dtype)
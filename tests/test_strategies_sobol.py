@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+from scipy.stats import qmc
+
+from optiseed import sobol_sample
+from optiseed.strategies import _sobol_core
+
+
+@pytest.mark.parametrize("bounds", [None, [(-1.0, 1.0), (5.0, 6.0)]])
+def test_sobol_dtype_casts_output(bounds):
+    full = sobol_sample(16, 2, seed=0, bounds=bounds)
+    half = sobol_sample(16, 2, seed=0, bounds=bounds, dtype=np.float32)
+
+    assert full.dtype == np.float64
+    assert half.dtype == np.float32
+    np.testing.assert_array_equal(half, full.astype(np.float32))
+
+
+@pytest.mark.parametrize("dtype", [int, np.uint8])
+def test_sobol_rejects_non_float_dtype(dtype):
+    with pytest.raises(ValueError, match="dtype"):
+        sobol_sample(4, 2, dtype=dtype)
+
+
+def test_sobol_falls_back_without_direction_helper(monkeypatch):
+    monkeypatch.setenv("OPTISEED_FAST_SOBOL", "1")
+    monkeypatch.setattr(_sobol_core, "AVAILABLE", False)
+
+    samples = sobol_sample(16, 3, scramble=False)
+
+    np.testing.assert_array_equal(samples, qmc.Sobol(3, scramble=False).random(16))
+
+
+def test_sobol_fast_path_is_opt_in(monkeypatch):
+    from optiseed.strategies import sobol
+
+    monkeypatch.delenv("OPTISEED_FAST_SOBOL", raising=False)
+
+    assert not sobol._use_fast_sobol(16, 3, scramble=False)
+
+
+requires_fast = pytest.mark.skipif(
+    not _sobol_core.AVAILABLE, reason="numba not installed"
+)
+_MAX_DIMS = _sobol_core.MAX_SPECIALIZED_DIMS
+
+
+@requires_fast
+@pytest.mark.parametrize("dims", [1, 2, 3, _MAX_DIMS, _MAX_DIMS + 1, 40])
+@pytest.mark.parametrize("n", [1, 2, 7, 8, 9, 1000])
+def test_fast_sobol_matches_scipy(monkeypatch, n, dims):
+    monkeypatch.setenv("OPTISEED_FAST_SOBOL", "1")
+
+    samples = sobol_sample(n, dims, scramble=False)
+
+    np.testing.assert_array_equal(samples, qmc.Sobol(dims, scramble=False).random(n))
+
+
+@requires_fast
+def test_fast_sobol_leaves_scrambled_samples_to_scipy(monkeypatch):
+    monkeypatch.setenv("OPTISEED_FAST_SOBOL", "1")
+
+    samples = sobol_sample(16, 3, seed=2)
+
+    np.testing.assert_array_equal(samples, qmc.Sobol(3, seed=2).random(16))
+
+
+@requires_fast
+@pytest.mark.parametrize("dims", [3, 10])
+def test_fast_sobol_matches_scipy_across_lane_threshold(monkeypatch, dims):
+    monkeypatch.setenv("OPTISEED_FAST_SOBOL", "1")
+    threshold_n = _sobol_core.LANES_THRESHOLD // dims
+    expected = qmc.Sobol(dims, scramble=False).random(threshold_n + 13)
+
+    for n in (threshold_n - 1, expected.shape[0]):
+        samples = sobol_sample(n, dims, scramble=False)
+        assert samples.flags.c_contiguous
+        np.testing.assert_array_equal(samples, expected[:n])
+
+
+@requires_fast
+@pytest.mark.parametrize("dims", [1, 5, 17])
+@pytest.mark.parametrize("n", [1, 8, 13, 4099])
+def test_sobol_lane_kernel_matches_scalar_kernel(n, dims):
+    directions = _sobol_core.direction_numbers(dims)
+
+    lanes = _sobol_core.sobol_gray_lanes(n, dims, directions)
+
+    np.testing.assert_array_equal(lanes.T, _sobol_core.sobol_gray(n, dims, directions))
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 16, 100])
+@pytest.mark.parametrize("scramble", [True, False])
+def test_sobol_seeded_matches_fresh_engine(n, scramble):
+    expected = qmc.Sobol(4, scramble=scramble, seed=3).random(n)
+
+    first = sobol_sample(n, 4, scramble=scramble, seed=3)
+    first[:] = -1.0  # must not leak into the cached engine
+    second = sobol_sample(n, 4, scramble=scramble, seed=3)
+
+    np.testing.assert_array_equal(second, expected)
+
+
+def test_sobol_unseeded_scrambled_differs():
+    assert not np.array_equal(sobol_sample(16, 3), sobol_sample(16, 3))
+
+
+@requires_fast
+@pytest.mark.parametrize("dims", range(1, _MAX_DIMS + 1))
+@pytest.mark.parametrize("n", [1, 8, 13, 4099])
+def test_sobol_specialized_kernel_matches_scalar_kernel(n, dims):
+    kernel = _sobol_core.specialized_sobol_gray(dims)
+
+    raw = kernel(n, _sobol_core.direction_rows(dims))
+
+    expected = _sobol_core.sobol_gray(n, dims, _sobol_core.direction_numbers(dims))
+    np.testing.assert_array_equal(raw, expected)
+
+
+def test_sobol_engines_with_same_seed_draw_independently():
+    from optiseed.strategies import sobol
+
+    first = sobol._sobol_engine(3, True, 5)
+    second = sobol._sobol_engine(3, True, 5)
+    expected = qmc.Sobol(3, seed=5).random(16)
+
+    head = first.random(1)
+    head[:] = -1.0  # must not leak into the other engine
+    draws = [second.random(1), first.random(3), second.random(3), first.random(4)]
+
+    np.testing.assert_array_equal(np.vstack(draws[:1] + draws[2:3]), expected[:4])
+    np.testing.assert_array_equal(draws[1], expected[1:4])
+    np.testing.assert_array_equal(draws[3], expected[4:8])
+    np.testing.assert_array_equal(second.random(8), expected[4:12])